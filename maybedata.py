@@ -1,24 +1,46 @@
 """A Python implementation of a Maybe type that represents potentially missing values"""
 
 from __future__ import annotations
-from abc import abstractmethod
-from callableabc import CallableABC
 from collections.abc import Callable, Iterator
-from typing import Generic, NoReturn, Optional, TypeVar, cast, overload
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    NoReturn,
+    Optional,
+    SupportsIndex,
+    TypeVar,
+    cast,
+    overload,
+)
 
 __version__ = "0.8"
 
-__all__ = ("Maybe", "Just", "Nothing", "MissingValueError")
+__all__ = (
+    "Maybe",
+    "Just",
+    "Nothing",
+    "MissingValueError",
+    "maybe_get",
+    "maybe_map",
+    "maybe_map_many",
+    "maybe_bind",
+    "maybe_alternatively",
+)
 
 T = TypeVar("T", covariant=True)
 G = TypeVar("G")
 U = TypeVar("U")
 V = TypeVar("V")
 
+# Set to True to make Just() return shared instances for booleans, small integers, and the empty string.
+# Interned instances are shared by every caller, so their value must never be reassigned.
+intern_just_values = False
 
-class Maybe(CallableABC, Generic[T]):
+
+class Maybe(Generic[T]):
     """
-    Callable abstract base class for Just and Nothing.
+    Base class for Just and Nothing.
     A Maybe value represents a value that may or may not exist.
     To construct a Just, call Maybe with one argument.
     To construct a Nothing, call Maybe with no arguments.
@@ -30,11 +52,33 @@ class Maybe(CallableABC, Generic[T]):
     See also: Just, Nothing
     """
 
-    __slots__ = ("present", "value")
+    __slots__ = ("value",)
 
-    present: bool
+    present: ClassVar[bool]
     value: Optional[T]
 
+    @overload
+    def __new__(cls, arg: G, /) -> Just[G]:
+        ...
+
+    @overload
+    def __new__(cls) -> Nothing:
+        ...
+
+    def __new__(cls, *args: object, **kwargs: object) -> Maybe[Any]:
+        if cls is not Maybe:
+            return object.__new__(cls)
+        if kwargs:
+            raise TypeError("Maybe() takes no keyword arguments")
+        argc = len(args)
+        if argc == 1:
+            return Just(args[0])
+        if argc == 0:
+            return _NOTHING
+        raise TypeError(
+            f"Maybe() takes up to one positional argument, but {argc} were given"
+        )
+
     @overload
     @classmethod
     def _class_call(cls, arg: G, /) -> Just[G]:
@@ -46,15 +90,8 @@ class Maybe(CallableABC, Generic[T]):
         ...
 
     @classmethod
-    def _class_call(cls, *args: G) -> Just[G] | Nothing:
-        argc = len(args)
-        if argc > 1:
-            raise TypeError(
-                f"Maybe() takes up to one positional argument, but {argc} were given"
-            )
-        if argc == 0:
-            return Nothing()
-        return Just[G](args[0])
+    def _class_call(cls, *args: object) -> Maybe[Any]:
+        return Maybe.__new__(Maybe, *args)
 
     def assume_present(self) -> T:
         """
@@ -66,73 +103,79 @@ class Maybe(CallableABC, Generic[T]):
         else:
             raise MissingValueError(f"{self!r} is a missing value")
 
-    @abstractmethod
     def get(self: Maybe[G], /, default: G) -> G:
         """
         Return the value if it is present, otherwise, return default.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def map(self: Maybe[G], f: Callable[[G], U], /) -> Maybe[U]:
         """
         Apply a function on the value, if it exists.
         Returns a new Maybe value containing the transformed value, if a value was present.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def replace(self: Maybe[object], value: U, /) -> Maybe[U]:
         """
         Replace the value with a new value, if it exists.
         Returns a new Maybe value containing the new value, if a value was present.
         maybe.replace(value) is equivalent to maybe.map(lambda _: value).
+        maybe.replace(value1).replace(value2) is equivalent to maybe.replace(value2).
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def then(self: Maybe[object], maybe: Maybe[U], /) -> Maybe[U]:
         """
         Replace a Maybe value with another Maybe value, if the first value is present.
         Returns the passed second Maybe value, unless the first value is missing.
         maybe1.then(maybe2) is equivalent to maybe1.bind(lambda _: maybe2).
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def alternatively(self: Maybe[G], maybe: Maybe[G], /) -> Maybe[G]:
         """
         Replace a Maybe value with another Maybe value, if the first value is not present.
         Returns the passed second Maybe value, unless the first value is present.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def bind(self: Maybe[G], f: Callable[[G], Maybe[U]], /) -> Maybe[U]:
         """
         Construct a new Maybe value with the value in the first Maybe value, if it exists.
         Calls the passed function on the value, returning the result, if the value is present.
         maybe.bind(f) is equivalent to maybe.map(f).join().
         """
-        pass
+        raise NotImplementedError
+
+    def chain(self: Maybe[object], *fs: Callable[[Any], Maybe[Any]]) -> Maybe[Any]:
+        """
+        Bind several functions in sequence, stopping at the first missing value.
+        maybe.chain(f, g, h) is equivalent to maybe.bind(f).bind(g).bind(h), but does not dispatch through bind for every step.
+        Prefer this form for long pipelines.
+        """
+        maybe: Maybe[Any] = self
+        for f in fs:
+            if not maybe.present:
+                break
+            maybe = f(maybe.value)
+        return maybe
 
-    @abstractmethod
     def join(self: Maybe[Maybe[G]]) -> Maybe[G]:
         """
         Flatten a Maybe value potentially containing another Maybe value.
         Returns the value, if it exists, and a missing value otherwise.
         maybe.join() is equivalent to maybe.bind(lambda x: x).
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def ap(self: Maybe[Callable[[G], U]], maybe: Maybe[G], /) -> Maybe[U]:
         """
         Apply a function from inside a Maybe value onto the value in another Maybe value, if both exist.
         Returns a missing value if any of the Maybe operands is missing.
         maybe1.ap(f, maybe2) is equivalent to maybe1.flatmap(lambda f: maybe2.flatmap(lambda x: f(x)))
         """
-        pass
+        raise NotImplementedError
 
     @classmethod
     def lift2(
@@ -142,7 +185,9 @@ class Maybe(CallableABC, Generic[T]):
         Apply a function over two Maybe values, returning a missing value if any inputs were missing.
         Maybe.lift2(f, maybe1, maybe2) is equivalent to maybe1.map(lambda x: lambda y: f(x, y)).ap(maybe2)
         """
-        return maybe1.map(lambda x: lambda y: f(x, y)).ap(maybe2)
+        if maybe1.present and maybe2.present:
+            return Just(f(maybe1.value, maybe2.value))  # type: ignore[arg-type]
+        return _NOTHING
 
     @classmethod
     def lift(
@@ -152,18 +197,10 @@ class Maybe(CallableABC, Generic[T]):
         Apply a function that takes multiple arguments over multiple Maybe values, returning a missing value if any inputs were missing.
         This is a general version of Maybe.lift2.
         """
-        values: list[object] = []
-        is_missing = False
         for maybe in args:
-            if maybe.present:
-                values.append(maybe.value)
-            else:
-                is_missing = True
-                break
-        if is_missing:
-            return cls._class_call()
-        else:
-            return cls._class_call(f(*values))
+            if not maybe.present:
+                return cls._class_call()
+        return cls._class_call(f(*[maybe.value for maybe in args]))
 
     @classmethod
     def from_optional(cls: type[Maybe[G]], value: Optional[G], /) -> Just[G] | Nothing:
@@ -171,6 +208,8 @@ class Maybe(CallableABC, Generic[T]):
         Create a Maybe value from a value that is potentially None.
         Returns a present value if value is not None, else returns a missing value.
         """
+        if cls is Maybe:
+            return _NOTHING if value is None else Just(value)
         if value is None:
             return cls._class_call()
         else:
@@ -182,16 +221,18 @@ class Maybe(CallableABC, Generic[T]):
         Create a Maybe value from a value and a boolean.
         Returns a missing value if present is False, else returns a present value.
         """
+        if cls is Maybe:
+            return Just(value) if present else _NOTHING
         if present:
             return cls._class_call(value)
         else:
             return cls._class_call()
 
     def __or__(self: Maybe[G], other: Maybe[G]) -> Maybe[G]:
-        return self.alternatively(other)
+        return self if self.present else other
 
     def __rshift__(self: Maybe[object], other: Maybe[U]) -> Maybe[U]:
-        return self.then(other)
+        return other if self.present else _NOTHING
 
 
 class Just(Maybe[T]):
@@ -204,16 +245,27 @@ class Just(Maybe[T]):
     See also: Maybe, Nothing
     """
 
-    __slots__ = ("present", "value")
+    __slots__ = ()
 
+    present: ClassVar[bool] = True
     value: T
 
+    def __new__(cls, *args: Any, **kwargs: Any) -> Just[Any]:
+        if intern_just_values and cls is Just and len(args) == 1:
+            value = args[0]
+            # Only types whose hashing cannot fail and whose equal values are interchangeable are looked up.
+            t = type(value)
+            if t is bool or t is int or t is str:
+                interned = _INTERNED_JUSTS.get((t, value))
+                if interned is not None:
+                    return interned
+        return object.__new__(cls)
+
     def __init__(self: Just[T], value: T, /) -> None:
-        self.present = True
         self.value = value
 
-    def get(self: Maybe[G], /, default: G) -> G:
-        return cast(G, self.value)
+    def get(self: Just[G], /, default: G) -> G:
+        return self.value
 
     def map(self: Just[G], f: Callable[[G], U], /) -> Just[U]:
         return Just(f(self.value))
@@ -234,15 +286,17 @@ class Just(Maybe[T]):
         return self.value
 
     def ap(self: Just[Callable[[G], U]], maybe: Maybe[G]) -> Maybe[U]:
-        return maybe.map(self.value)
+        return Just(self.value(maybe.value)) if maybe.present else _NOTHING  # type: ignore[arg-type]
 
     def __repr__(self: Just[object]) -> str:
         return f"Just({self.value!r})"
 
     def __eq__(self: Just[object], other: object) -> bool:
-        if isinstance(other, Just):
+        if self is other:
+            return True
+        elif isinstance(other, Just):
             return bool(self.value == other.value)
-        elif isinstance(other, Nothing):
+        elif other is _NOTHING:
             return False
         else:
             return NotImplemented
@@ -265,56 +319,87 @@ class Just(Maybe[T]):
     __match_args__ = ("value",)
 
 
+_INTERNED_JUSTS: dict[tuple[type, object], Just[Any]] = {}
+for _value in (False, True, "", *range(-5, 257)):
+    _just: Just[Any] = object.__new__(Just)
+    _just.value = _value
+    _INTERNED_JUSTS[type(_value), _value] = _just
+del _value, _just
+
+
 class MissingValueError(ValueError):
     "Raised to indicate a potentially missing value was missing."
     pass
 
 
+_NOTHING_HASH = hash(())
+
+# An exhausted iterator stays exhausted, so one instance can be shared by every Nothing.__iter__ call.
+_EMPTY_ITERATOR: Iterator[NoReturn] = iter(())
+
+
 class Nothing(Maybe[NoReturn]):
     """
     Subclass of Maybe that indicates a value is missing.
     Construct with no value: Nothing()
+    Nothing() always returns the same instance, so Nothing values can be compared with `is`.
+    Subclasses of Nothing construct their own instances.
     Property Nothing.present is always False.
     Property Nothing.value is always None.
     Nothing() is supported in pattern matching.
     See also: Maybe, Just
     """
 
-    __slots__ = ("present", "value")
+    __slots__ = ()
+
+    present: ClassVar[bool] = False
 
-    def __init__(self: Nothing) -> None:
-        self.present = False
-        self.value = None
+    def __new__(cls, *args: object, **kwargs: object) -> Nothing:
+        if cls is not Nothing:
+            self = object.__new__(cls)
+            self.value = None
+            return self
+        if args or kwargs:
+            raise TypeError("Nothing() takes no arguments")
+        return _NOTHING
+
+    def __reduce_ex__(
+        self: Nothing, protocol: SupportsIndex, /
+    ) -> str | tuple[Any, ...]:
+        # Unpickling and copying the singleton must give back the singleton, whatever the protocol.
+        if type(self) is Nothing:
+            return (Nothing, ())
+        return super().__reduce_ex__(protocol)
 
     def get(self: Nothing, /, default: G) -> G:
         return default
 
     def map(self: Nothing, f: Callable[[NoReturn], object], /) -> Nothing:
-        return Nothing()
+        return _NOTHING
 
     def replace(self: Nothing, value: object, /) -> Nothing:
-        return Nothing()
+        return _NOTHING
 
     def then(self: Nothing, maybe: Maybe[object], /) -> Nothing:
-        return Nothing()
+        return _NOTHING
 
     def alternatively(self: Nothing, maybe: Maybe[G], /) -> Maybe[G]:
         return maybe
 
     def bind(self: Nothing, f: Callable[[NoReturn], Maybe[object]], /) -> Nothing:
-        return Nothing()
+        return _NOTHING
 
     def join(self: Nothing) -> Nothing:
-        return Nothing()
+        return _NOTHING
 
     def ap(self: Nothing, maybe: Maybe[object]) -> Nothing:
-        return Nothing()
+        return _NOTHING
 
     def __repr__(self: Nothing) -> str:
         return "Nothing()"
 
     def __eq__(self: Nothing, other: object) -> bool:
-        if isinstance(other, Nothing):
+        if self is other or isinstance(other, Nothing):
             return True
         elif isinstance(other, Just):
             return False
@@ -322,7 +407,7 @@ class Nothing(Maybe[NoReturn]):
             return NotImplemented
 
     def __hash__(self: Nothing) -> int:
-        return hash(())
+        return _NOTHING_HASH
 
     def __bool__(self: Nothing) -> bool:
         return False
@@ -331,9 +416,58 @@ class Nothing(Maybe[NoReturn]):
         return 0
 
     def __iter__(self: Nothing) -> Iterator[NoReturn]:
-        return iter(())
+        return _EMPTY_ITERATOR
 
     def __contains__(self, item: object) -> bool:
         return False
 
     __match_args__ = ()
+
+
+_NOTHING: Nothing = object.__new__(Nothing)
+_NOTHING.value = None
+
+
+def maybe_get(maybe: Maybe[G], default: G, /) -> G:
+    """
+    Return the value of a Maybe value if it is present, otherwise, return default.
+    maybe_get(maybe, default) is equivalent to maybe.get(default), but avoids the method lookup.
+    """
+    return maybe.value if maybe.present else default  # type: ignore[return-value]
+
+
+def maybe_map(maybe: Maybe[G], f: Callable[[G], U], /) -> Maybe[U]:
+    """
+    Apply a function on the value of a Maybe value, if it exists.
+    maybe_map(maybe, f) is equivalent to maybe.map(f), but avoids the method lookup.
+    """
+    return Just(f(maybe.value)) if maybe.present else _NOTHING  # type: ignore[arg-type]
+
+
+def maybe_map_many(maybe: Maybe[Any], /, *fs: Callable[[Any], Any]) -> Maybe[Any]:
+    """
+    Apply several functions in sequence on the value of a Maybe value, if it exists.
+    maybe_map_many(maybe, f, g, h) is equivalent to maybe.map(f).map(g).map(h), but only creates one new Maybe value.
+    """
+    if not maybe.present:
+        return _NOTHING
+    value = maybe.value
+    for f in fs:
+        value = f(value)
+    return Just(value)
+
+
+def maybe_bind(maybe: Maybe[G], f: Callable[[G], Maybe[U]], /) -> Maybe[U]:
+    """
+    Call a function returning a Maybe value on the value of a Maybe value, if it exists.
+    maybe_bind(maybe, f) is equivalent to maybe.bind(f), but avoids the method lookup.
+    """
+    return f(maybe.value) if maybe.present else _NOTHING  # type: ignore[arg-type]
+
+
+def maybe_alternatively(maybe1: Maybe[G], maybe2: Maybe[G], /) -> Maybe[G]:
+    """
+    Return the first Maybe value if it is present, otherwise, return the second.
+    maybe_alternatively(maybe1, maybe2) is equivalent to maybe1.alternatively(maybe2), but avoids the method lookup.
+    """
+    return maybe1 if maybe1.present else maybe2